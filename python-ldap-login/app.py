@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-import datetime
+import hashlib
+import os
+import queue
+import re
 import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple
 
-from flask import Flask, render_template_string, request
+from flask import Flask, Response, request
+from markupsafe import Markup, escape
 
 try:
     import ldap
@@ -15,38 +24,352 @@ except ImportError as exc:
     ) from exc
 
 
-@dataclass
-class DebugEntry:
-    timestamp: str
-    message: str
+# Log levels double as CSS classes in the debug log.
+LEVEL_INFO = sys.intern("info")
+LEVEL_SUCCESS = sys.intern("success")
+LEVEL_ERROR = sys.intern("error")
+
+
+class DebugEntry(NamedTuple):
+    ts_ns: int
+    message: Markup
     level: str
 
 
-def load_env_file(path: str) -> Dict[str, str]:
-    env: Dict[str, str] = {}
+LOG_STREAM_TIMEOUT = 60.0
+
+
+class LogQueue:
+    """Hands log entries from the LDAP worker thread to the streamed response."""
+
+    def __init__(self, timeout: float = LOG_STREAM_TIMEOUT) -> None:
+        self._entries: "queue.SimpleQueue[Optional[DebugEntry]]" = queue.SimpleQueue()
+        self._timeout = timeout
+        self.abandoned = False
+
+    def append(self, entry: DebugEntry) -> None:
+        # Nobody reads the queue once the response has stopped streaming.
+        if not self.abandoned:
+            self._entries.put(entry)
+
+    def close(self) -> None:
+        self._entries.put(None)
+
+    def __iter__(self) -> Iterator[DebugEntry]:
+        try:
+            while True:
+                try:
+                    entry = self._entries.get(timeout=self._timeout)
+                except queue.Empty:
+                    # Finish the page rather than leave the response hanging.
+                    message = f"ERROR: No progress from the LDAP test for {self._timeout:g} seconds - giving up"
+                    yield DebugEntry(time.time_ns(), escape(message), LEVEL_ERROR)
+                    return
+                if entry is None:
+                    return
+                yield entry
+        finally:
+            # Also reached when the client disconnects mid-stream; tells the
+            # worker to skip any LDAP work it has not started yet.
+            self.abandoned = True
+
+
+# Parsed .env files keyed by path, invalidated when the file's mtime changes.
+_ENV_CACHE: Dict[str, Tuple[int, Mapping[str, str]]] = {}
+
+# One KEY=value assignment per line; a value wrapped in double quotes is unquoted.
+_ENV_RE = re.compile(
+    rb'(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(?:"([^"\r\n]*)"|([^\r\n]*?))[ \t\r]*$'
+)
+
+
+def load_env_file(path: str) -> Mapping[str, str]:
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _ENV_CACHE.pop(path, None)
+        return MappingProxyType({})
+
+    cached = _ENV_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     try:
-        with open(path, "r", encoding="utf-8") as env_file:
-            for line in env_file:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#") or "=" not in stripped:
-                    continue
-                key, value = stripped.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                if value.startswith('"') and value.endswith('"') and len(value) >= 2:
-                    value = value[1:-1]
-                env[key] = value
+        with open(path, "rb") as env_file:
+            content = env_file.read()
     except FileNotFoundError:
-        return {}
-    return env
+        return MappingProxyType({})
+
+    env: Dict[str, str] = {}
+    for match in _ENV_RE.finditer(content):
+        key, quoted, bare = match.groups()
+        value = quoted if quoted is not None else bare
+        env[key.decode("utf-8")] = value.decode("utf-8")
 
+    frozen = MappingProxyType(env)
+    _ENV_CACHE[path] = (mtime_ns, frozen)
+    return frozen
 
-def now_stamp() -> str:
-    return datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
 
+DNS_CACHE_TTL = 300.0
 
-def add_log(logs: List[DebugEntry], message: str, level: str = "info") -> None:
-    logs.append(DebugEntry(timestamp=now_stamp(), message=message, level=level))
+# getaddrinfo results keyed by (host, port), stored with the monotonic time they
+# were resolved so a lowered TTL takes effect on entries that are already cached.
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[float, List[Tuple[Any, ...]]]] = {}
+
+
+def cached_getaddrinfo(host: str, port: int, ttl: float = DNS_CACHE_TTL) -> Tuple[List[Tuple[Any, ...]], bool]:
+    """Return the addresses for (host, port) and whether they came from the cache."""
+    key = (host, port)
+    now = time.monotonic()
+    if ttl <= 0:
+        _DNS_CACHE.pop(key, None)
+    else:
+        cached = _DNS_CACHE.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1], True
+
+    # Failures raise socket.gaierror and are deliberately not cached.
+    addresses = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    if ttl > 0:
+        _DNS_CACHE[key] = (now, addresses)
+    return addresses, False
+
+
+# CA certificate state keyed by path: (mtime_ns, blake2b digest, is_pem).
+_CA_CERT_CACHE: Dict[str, Tuple[int, str, bool]] = {}
+
+
+def inspect_ca_cert(path: str) -> Tuple[str, bool]:
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _CA_CERT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1], cached[2]
+
+    with open(path, "rb") as cert_file:
+        content = cert_file.read()
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    is_pem = b"BEGIN CERTIFICATE" in content
+    _CA_CERT_CACHE[path] = (mtime_ns, digest, is_pem)
+    return digest, is_pem
+
+
+LDAP_POOL_SIZE = 8
+LDAP_POOL_MAX_IDLE = 60.0
+LDAP_OPERATION_TIMEOUT = 10.0
+LDAP_EXECUTOR_WORKERS = 32
+
+# Blocking python-ldap work runs here, off the request thread. The pool is
+# bounded so a burst of slow binds cannot spawn unlimited threads.
+_LDAP_EXECUTOR = ThreadPoolExecutor(max_workers=LDAP_EXECUTOR_WORKERS, thread_name_prefix="ldap")
+
+# One slot per executor worker, so work is turned away instead of queueing
+# behind slow binds when every worker is busy.
+_LDAP_SLOTS = threading.BoundedSemaphore(LDAP_EXECUTOR_WORKERS)
+
+
+def _submit_ldap_work(func: Callable[..., None], *args: Any) -> bool:
+    if not _LDAP_SLOTS.acquire(blocking=False):
+        return False
+
+    def run() -> None:
+        try:
+            func(*args)
+        finally:
+            _LDAP_SLOTS.release()
+
+    _LDAP_EXECUTOR.submit(run)
+    return True
+
+PoolKey = Tuple[str, int, str, str]
+
+# Idle LDAP connections keyed by (host, port, ca_cert_file, ca_digest), stored as
+# (monotonic release time, connection). Each queue is bounded; connections
+# released into a full pool are closed instead. Callers only use the pool
+# when the configured size is positive.
+_LDAP_POOLS: Dict[PoolKey, "queue.Queue[Any]"] = {}
+_LDAP_POOLS_LOCK = threading.Lock()
+
+
+def _close_quietly(connection: Any) -> None:
+    try:
+        connection.unbind_s()
+    except ldap.LDAPError:
+        pass
+
+
+def _get_pool(key: PoolKey, size: int) -> "queue.Queue[Any]":
+    pool = _LDAP_POOLS.get(key)
+    if pool is not None and pool.maxsize == size:
+        return pool
+
+    with _LDAP_POOLS_LOCK:
+        pool = _LDAP_POOLS.get(key)
+        if pool is None or pool.maxsize != size:
+            # TC2_CONFIG_LDAP_POOL_SIZE changed: rebuild the queue with the new
+            # bound and carry over as many idle connections as still fit.
+            resized: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+            while pool is not None:
+                try:
+                    idle = pool.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    resized.put_nowait(idle)
+                except queue.Full:
+                    _close_quietly(idle[1])
+            pool = _LDAP_POOLS[key] = resized
+    return pool
+
+
+def _get_pooled_conn(key: PoolKey, size: int) -> Optional[Any]:
+    pool = _get_pool(key, size)
+    while True:
+        try:
+            released_at, connection = pool.get_nowait()
+        except queue.Empty:
+            return None
+        # A firewall or NAT may have silently dropped a long-idle socket.
+        if time.monotonic() - released_at <= LDAP_POOL_MAX_IDLE:
+            return connection
+        _close_quietly(connection)
+
+
+def _release_conn(key: PoolKey, size: int, connection: Any) -> bool:
+    try:
+        _get_pool(key, size).put_nowait((time.monotonic(), connection))
+        return True
+    except queue.Full:
+        connection.unbind_s()
+        return False
+
+
+# ldap.initialize() performs no network I/O: the TCP connect, the LDAPS
+# handshake and the bind all happen inside the single simple_bind_s() call.
+def _open_connection(logs: LogQueue, ldap_uri: str, use_ssl: bool, ca_cert_file: str) -> Any:
+    add_log(logs, f"Initializing LDAP connection: {ldap_uri}")
+
+    connection = ldap.initialize(ldap_uri)
+    add_log(logs, "LDAP connection initialized")
+
+    # Set connection options
+    connection.set_option(ldap.OPT_PROTOCOL_VERSION, 3)
+    add_log(logs, "Set protocol version: LDAPv3")
+
+    connection.set_option(ldap.OPT_NETWORK_TIMEOUT, 10.0)
+    add_log(logs, "Set network timeout: 10 seconds")
+
+    # Bounds each operation, so a bind on a dead pooled socket fails fast
+    connection.set_option(ldap.OPT_TIMEOUT, LDAP_OPERATION_TIMEOUT)
+    add_log(logs, f"Set operation timeout: {LDAP_OPERATION_TIMEOUT:g} seconds")
+
+    # Apply TLS settings only for LDAPS
+    if use_ssl:
+        connection.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
+        add_log(logs, "Connection-level OPT_X_TLS_REQUIRE_CERT: DEMAND")
+
+        if ca_cert_file:
+            connection.set_option(ldap.OPT_X_TLS_CACERTFILE, ca_cert_file)
+            add_log(logs, "Connection-level OPT_X_TLS_CACERTFILE set")
+
+        # Force TLS context reload after setting options
+        connection.set_option(ldap.OPT_X_TLS_NEWCTX, 0)
+        add_log(logs, "TLS context reloaded with new options")
+
+    return connection
+
+
+@dataclass(frozen=True)
+class LdapSettings:
+    host: str
+    port: int
+    port_configured: bool
+    ca_cert_file: str
+    domain: str
+    dns_ttl: float
+    pool_size: int
+    warmup: bool
+    errors: Tuple[str, ...]
+
+
+# Parsed settings keyed by .env path, valid while load_env_file returns the same mapping.
+_SETTINGS_CACHE: Dict[str, Tuple[Mapping[str, str], LdapSettings]] = {}
+
+
+def parse_settings(env: Mapping[str, str]) -> LdapSettings:
+    host = env.get("TC2_CONFIG_LDAP_HOST", "").strip()
+    port_raw = env.get("TC2_CONFIG_LDAP_PORT", "").strip()
+    ca_cert_file = env.get("TC2_CONFIG_LDAP_TLS_CA_CERT_FILE", "").strip()
+    domain = env.get("TC2_CONFIG_LDAP_DOMAIN", "").strip()
+    dns_ttl_raw = env.get("TC2_CONFIG_LDAP_DNS_CACHE_TTL", "").strip()
+    pool_size_raw = env.get("TC2_CONFIG_LDAP_POOL_SIZE", "").strip()
+    warmup_raw = env.get("TC2_CONFIG_LDAP_WARMUP", "").strip()
+    errors: List[str] = []
+
+    port = 389
+    if port_raw:
+        try:
+            port = int(port_raw)
+        except ValueError:
+            errors.append(f"ERROR: Invalid LDAP port: {port_raw}")
+
+    dns_ttl = DNS_CACHE_TTL
+    if dns_ttl_raw:
+        try:
+            dns_ttl = float(dns_ttl_raw)
+        except ValueError:
+            errors.append(f"ERROR: Invalid DNS cache TTL: {dns_ttl_raw}")
+
+    pool_size = LDAP_POOL_SIZE
+    if pool_size_raw:
+        try:
+            pool_size = int(pool_size_raw)
+        except ValueError:
+            errors.append(f"ERROR: Invalid LDAP pool size: {pool_size_raw}")
+
+    return LdapSettings(
+        host=host,
+        port=port,
+        port_configured=bool(port_raw),
+        ca_cert_file=ca_cert_file,
+        domain=domain,
+        dns_ttl=dns_ttl,
+        pool_size=pool_size,
+        warmup=warmup_raw.lower() in ("1", "true", "yes", "on"),
+        errors=tuple(errors),
+    )
+
+
+def _settings(path: str) -> LdapSettings:
+    env = load_env_file(path)
+    cached = _SETTINGS_CACHE.get(path)
+    if cached is not None and cached[0] is env:
+        return cached[1]
+
+    settings = parse_settings(env)
+    _SETTINGS_CACHE[path] = (env, settings)
+    return settings
+
+
+def format_stamp(seconds: int) -> str:
+    return time.strftime("[%Y-%m-%d %H:%M:%S]", time.localtime(seconds))
+
+
+def add_log(logs: LogQueue, message: str, level: str = LEVEL_INFO) -> None:
+    # Escape once here so rendering can emit the message as-is.
+    logs.append(DebugEntry(time.time_ns(), escape(message), level))
+
+
+def stamp_logs(logs: Iterable[DebugEntry]) -> Iterator[Tuple[str, DebugEntry]]:
+    # Entries logged within the same second share one formatted stamp.
+    last_second = -1
+    stamp = ""
+    for entry in logs:
+        second = entry.ts_ns // 1_000_000_000
+        if second != last_second:
+            stamp = format_stamp(second)
+            last_second = second
+        yield stamp, entry
 
 
 app = Flask(__name__)
@@ -150,191 +473,248 @@ HTML_TEMPLATE = """
             <button type="submit">Test Authentication</button>
         </form>
 
-        {% if logs %}
         <div class="debug-log">
             <strong style="display: block; margin-bottom: 10px; color: #fff;">Debug Log:</strong>
             <pre>
-{% for log in logs %}
-<div class="log-entry {{ log.level }}">{{ log.timestamp }} {{ log.message }}</div>
-{% endfor %}
+{{ logs }}
             </pre>
         </div>
-        {% endif %}
     </div>
 </body>
 </html>
 """
 
+# The page is static apart from the username value and the log lines, so it is
+# rendered once around two markers and split into constant byte strings.
+_USERNAME_MARKER = "\x00username\x00"
+_LOGS_MARKER = "\x00logs\x00"
+_PAGE = app.jinja_env.from_string(HTML_TEMPLATE).render(
+    username=Markup(_USERNAME_MARKER),
+    logs=Markup(_LOGS_MARKER),
+)
+_PAGE_PREFIX, _, _PAGE_REST = _PAGE.partition(_USERNAME_MARKER)
+_PAGE_MIDDLE, _, _PAGE_SUFFIX = _PAGE_REST.partition(_LOGS_MARKER)
+PAGE_PREFIX = _PAGE_PREFIX.encode("utf-8")
+PAGE_MIDDLE = _PAGE_MIDDLE.encode("utf-8")
+PAGE_SUFFIX = _PAGE_SUFFIX.encode("utf-8")
+
+
+def stream_page(username_value: Markup, logs: LogQueue) -> Iterator[bytes]:
+    yield b"".join([PAGE_PREFIX, username_value.encode("utf-8"), PAGE_MIDDLE])
+    # Messages are escaped by add_log; levels and stamps never contain markup.
+    for timestamp, log in stamp_logs(logs):
+        yield f'\n<div class="log-entry {log.level}">{timestamp} {log.message}</div>\n'.encode("utf-8")
+    yield PAGE_SUFFIX
+
+
+def _prepare_connection(logs: LogQueue, settings: LdapSettings) -> Tuple[str, PoolKey, bool]:
+    host = settings.host
+    port = settings.port
+    ca_cert_file = settings.ca_cert_file
+    use_ssl = port == 636
+    add_log(logs, f"SSL/TLS mode: {'LDAPS (implicit SSL)' if use_ssl else 'LDAP (plain, no TLS)'}")
+
+    # Configure TLS options only for LDAPS
+    ca_digest = ""
+    if use_ssl:
+        if ca_cert_file:
+            add_log(logs, f"Loading CA certificate from: {ca_cert_file}")
+            try:
+                ca_digest, is_pem = inspect_ca_cert(ca_cert_file)
+                if is_pem:
+                    add_log(logs, "CA certificate file format: PEM (valid)")
+                else:
+                    add_log(logs, "WARNING: CA certificate may not be in PEM format", LEVEL_ERROR)
+            except FileNotFoundError:
+                add_log(logs, f"ERROR: CA certificate file not found: {ca_cert_file}", LEVEL_ERROR)
+            except PermissionError:
+                add_log(logs, f"ERROR: Cannot read CA certificate file (permission denied): {ca_cert_file}", LEVEL_ERROR)
+        else:
+            add_log(logs, "No CA certificate configured - using system certificates")
+    else:
+        add_log(logs, "TLS disabled for plain LDAP connection")
 
-@app.route("/", methods=["GET", "POST"])
-def ldap_test() -> str:
-    logs: List[DebugEntry] = []
-    add_log(logs, "LDAP Test Started")
-
-    env = load_env_file(f"{app.root_path}/.env")
-    host = env.get("TC2_CONFIG_LDAP_HOST", "").strip()
-    port_raw = env.get("TC2_CONFIG_LDAP_PORT", "").strip()
-    ca_cert_file = env.get("TC2_CONFIG_LDAP_TLS_CA_CERT_FILE", "").strip()
-    domain = env.get("TC2_CONFIG_LDAP_DOMAIN", "").strip()
-
-    port = 389
-    if port_raw:
-        try:
-            port = int(port_raw)
-        except ValueError:
-            add_log(logs, f"ERROR: Invalid LDAP port: {port_raw}", "error")
-
-    add_log(logs, f"AD Config loaded - Host: {host or 'N/A'}")
-    add_log(logs, f"AD Config - Domain: {domain or 'N/A'}")
-    add_log(logs, f"AD Config - Port: {port if port_raw else 'N/A'}")
-
-    if ca_cert_file:
-        add_log(logs, f"CA cert file configured: {ca_cert_file}")
-
-    if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        password = request.form.get("password", "")
-
-        add_log(logs, f"Attempting to authenticate user: {username}")
+    # DNS resolution check
+    add_log(logs, f"Resolving hostname: {host}")
+    connect_hosts = [host]
+    try:
+        ip_addresses, from_cache = cached_getaddrinfo(host, port, ttl=settings.dns_ttl)
+        resolved_ips = list(dict.fromkeys(addr[4][0] for addr in ip_addresses))
+        add_log(logs, f"DNS resolved to{' (cached)' if from_cache else ''}: {', '.join(resolved_ips)}")
+        # libldap verifies the server certificate against the URI host, so
+        # only plain LDAP can connect to the resolved addresses directly. All of
+        # them go into the URI so libldap can still fail over between them.
+        if not use_ssl and resolved_ips:
+            connect_hosts = [f"[{ip}]" if ":" in ip else ip for ip in resolved_ips]
+            add_log(logs, f"Using resolved addresses for connection: {', '.join(resolved_ips)}")
+    except socket.gaierror as dns_err:
+        add_log(logs, f"ERROR: DNS resolution failed - {dns_err}", LEVEL_ERROR)
+
+    # Build LDAP URI
+    protocol = "ldaps" if use_ssl else "ldap"
+    ldap_uri = " ".join(f"{protocol}://{connect_host}:{port}" for connect_host in connect_hosts)
+    return ldap_uri, (host, port, ca_cert_file, ca_digest), use_ssl
+
+
+def _do_bind(logs: LogQueue, settings: LdapSettings, login_username: str, password: str) -> None:
+    # Runs on _LDAP_EXECUTOR; everything here may block on DNS or the network.
+    ldap_uri, pool_key, use_ssl = _prepare_connection(logs, settings)
+    pooling = settings.pool_size > 0
+    connection = None
+    reusable = False
+    try:
+        if pooling:
+            connection = _get_pooled_conn(pool_key, settings.pool_size)
+        else:
+            add_log(logs, "Connection pooling disabled - opening a fresh connection")
 
-        if not host:
-            add_log(logs, "ERROR: LDAP host missing in .env", "error")
-        elif not username or not password:
-            add_log(logs, "ERROR: Username or password missing", "error")
+        if connection is not None:
+            add_log(logs, f"Reusing pooled LDAP connection: {ldap_uri}")
+            add_log(logs, f"Attempting LDAP bind for user: {login_username}")
+            try:
+                connection.simple_bind_s(login_username, password)
+            except (ldap.SERVER_DOWN, ldap.TIMEOUT):
+                add_log(logs, "Pooled LDAP connection is stale - reconnecting")
+                _close_quietly(connection)
+                connection = None
+
+        if connection is None:
+            if logs.abandoned:
+                return
+            connection = _open_connection(logs, ldap_uri, use_ssl, settings.ca_cert_file)
+            add_log(logs, f"Attempting LDAP bind for user: {login_username}")
+            connection.simple_bind_s(login_username, password)
+
+        reusable = True
+        add_log(logs, "SUCCESS: User authenticated successfully!", LEVEL_SUCCESS)
+
+    except ldap.INVALID_CREDENTIALS:
+        # The server rejected the bind, but the connection itself is healthy.
+        reusable = True
+        add_log(logs, "ERROR: Invalid credentials - authentication failed", LEVEL_ERROR)
+    except ldap.SERVER_DOWN as exc:
+        add_log(logs, f"ERROR: LDAP server is down or unreachable", LEVEL_ERROR)
+        add_log(logs, f"Details: {exc}", LEVEL_ERROR)
+        if "certificate" in str(exc).lower():
+            add_log(logs, "HINT: This may be a TLS/SSL certificate issue", LEVEL_ERROR)
+    except ldap.CONNECT_ERROR as exc:
+        add_log(logs, f"ERROR: Could not connect to LDAP server", LEVEL_ERROR)
+        add_log(logs, f"Details: {exc}", LEVEL_ERROR)
+    except ldap.TIMEOUT:
+        add_log(logs, "ERROR: LDAP operation timed out", LEVEL_ERROR)
+    except ldap.LDAPError as exc:
+        add_log(logs, f"LDAP ERROR: {type(exc).__name__}", LEVEL_ERROR)
+        error_info = exc.args[0] if exc.args else {}
+        if isinstance(error_info, dict):
+            desc = error_info.get("desc", "Unknown error")
+            info = error_info.get("info", "")
+            add_log(logs, f"Description: {desc}", LEVEL_ERROR)
+            if info:
+                add_log(logs, f"Info: {info}", LEVEL_ERROR)
         else:
-            user_provided_domain = "@" in username
-            login_username = username if user_provided_domain or not domain else f"{username}@{domain}"
-            add_log(logs, f"Attempting authentication with: {login_username}")
-
-            use_ssl = port == 636
-            add_log(logs, f"SSL/TLS mode: {'LDAPS (implicit SSL)' if use_ssl else 'LDAP (plain, no TLS)'}")
-
-            # Configure TLS options only for LDAPS
-            if use_ssl:
-                if ca_cert_file:
-                    add_log(logs, f"Loading CA certificate from: {ca_cert_file}")
-                    try:
-                        with open(ca_cert_file, "r") as f:
-                            cert_content = f.read()
-                            if "BEGIN CERTIFICATE" in cert_content:
-                                add_log(logs, "CA certificate file format: PEM (valid)")
-                            else:
-                                add_log(logs, "WARNING: CA certificate may not be in PEM format", "error")
-                    except FileNotFoundError:
-                        add_log(logs, f"ERROR: CA certificate file not found: {ca_cert_file}", "error")
-                    except PermissionError:
-                        add_log(logs, f"ERROR: Cannot read CA certificate file (permission denied): {ca_cert_file}", "error")
-
-                    # Set CA certificate file globally
-                    ldap.set_option(ldap.OPT_X_TLS_CACERTFILE, ca_cert_file)
-                    add_log(logs, f"Set OPT_X_TLS_CACERTFILE: {ca_cert_file}")
+            add_log(logs, f"Error details: {exc}", LEVEL_ERROR)
+    except socket.timeout:
+        add_log(logs, "ERROR: Connection timed out", LEVEL_ERROR)
+    except OSError as exc:
+        add_log(logs, f"OS ERROR: {exc}", LEVEL_ERROR)
+        add_log(logs, f"Error number: {exc.errno}", LEVEL_ERROR)
+    finally:
+        if connection and reusable and pooling:
+            try:
+                if _release_conn(pool_key, settings.pool_size, connection):
+                    add_log(logs, "LDAP connection returned to pool")
                 else:
-                    add_log(logs, "No CA certificate configured - using system certificates")
+                    add_log(logs, "LDAP connection closed (pool full)")
+            except Exception:
+                add_log(logs, "LDAP connection cleanup (no active connection)")
+        elif connection:
+            try:
+                connection.unbind_s()
+                add_log(logs, "LDAP connection closed")
+            except Exception:
+                add_log(logs, "LDAP connection cleanup (no active connection)")
+        else:
+            add_log(logs, "No LDAP connection was established")
 
-                # Set TLS to DEMAND - require valid server certificate
-                ldap.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
-                add_log(logs, "Set OPT_X_TLS_REQUIRE_CERT: OPT_X_TLS_DEMAND (require valid certificate)")
-            else:
-                add_log(logs, "TLS disabled for plain LDAP connection")
 
-            # DNS resolution check
-            add_log(logs, f"Resolving hostname: {host}")
-            try:
-                ip_addresses = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_STREAM)
-                resolved_ips = list(set([addr[4][0] for addr in ip_addresses]))
-                add_log(logs, f"DNS resolved to: {', '.join(resolved_ips)}")
-            except socket.gaierror as dns_err:
-                add_log(logs, f"ERROR: DNS resolution failed - {dns_err}", "error")
-
-            # TCP connectivity check
-            add_log(logs, f"Testing TCP connectivity to {host}:{port}")
-            try:
-                test_socket = socket.create_connection((host, port), timeout=10)
-                add_log(logs, f"TCP connection successful to {host}:{port}")
-                test_socket.close()
-            except socket.timeout:
-                add_log(logs, f"ERROR: TCP connection timed out to {host}:{port}", "error")
-            except socket.error as sock_err:
-                add_log(logs, f"ERROR: TCP connection failed - {sock_err}", "error")
-
-            connection = None
+def warm_up(settings: LdapSettings) -> None:
+    # Fills the DNS and CA certificate caches and initializes libldap/OpenSSL
+    # before any user request does. The connection itself is pooled, but it is
+    # only reused if a request arrives within LDAP_POOL_MAX_IDLE of startup.
+    logs = LogQueue()
+    ldap_uri, pool_key, use_ssl = _prepare_connection(logs, settings)
+    connection = None
+    try:
+        connection = _open_connection(logs, ldap_uri, use_ssl, settings.ca_cert_file)
+        connection.simple_bind_s("", "")
+        if settings.pool_size > 0:
+            _release_conn(pool_key, settings.pool_size, connection)
+        else:
+            connection.unbind_s()
+        app.logger.info("LDAP warm-up connected to %s", ldap_uri)
+    except (ldap.LDAPError, OSError) as exc:
+        app.logger.warning("LDAP warm-up against %s failed: %s", ldap_uri, exc)
+        if connection is not None:
             try:
-                # Build LDAP URI
-                protocol = "ldaps" if use_ssl else "ldap"
-                ldap_uri = f"{protocol}://{host}:{port}"
-                add_log(logs, f"Initializing LDAP connection: {ldap_uri}")
+                connection.unbind_s()
+            except ldap.LDAPError:
+                pass
 
-                connection = ldap.initialize(ldap_uri)
-                add_log(logs, "LDAP connection initialized")
 
-                # Set connection options
-                connection.set_option(ldap.OPT_PROTOCOL_VERSION, 3)
-                add_log(logs, "Set protocol version: LDAPv3")
+def _run_test(logs: LogQueue, env_path: str, is_post: bool, username: str, password: str) -> None:
+    # Runs on _LDAP_EXECUTOR for POSTs while the response streams whatever it
+    # logs; GETs only read the settings and run it inline.
+    try:
+        add_log(logs, "LDAP Test Started")
 
-                connection.set_option(ldap.OPT_NETWORK_TIMEOUT, 10.0)
-                add_log(logs, "Set network timeout: 10 seconds")
+        settings = _settings(env_path)
+        for error in settings.errors:
+            add_log(logs, error, LEVEL_ERROR)
 
-                # Apply TLS settings only for LDAPS
-                if use_ssl:
-                    connection.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
-                    add_log(logs, "Connection-level OPT_X_TLS_REQUIRE_CERT: DEMAND")
+        add_log(logs, f"AD Config loaded - Host: {settings.host or 'N/A'}")
+        add_log(logs, f"AD Config - Domain: {settings.domain or 'N/A'}")
+        add_log(logs, f"AD Config - Port: {settings.port if settings.port_configured else 'N/A'}")
 
-                    if ca_cert_file:
-                        connection.set_option(ldap.OPT_X_TLS_CACERTFILE, ca_cert_file)
-                        add_log(logs, "Connection-level OPT_X_TLS_CACERTFILE set")
+        if settings.ca_cert_file:
+            add_log(logs, f"CA cert file configured: {settings.ca_cert_file}")
 
-                    # Force TLS context reload after setting options
-                    connection.set_option(ldap.OPT_X_TLS_NEWCTX, 0)
-                    add_log(logs, "TLS context reloaded with new options")
+        if is_post:
+            add_log(logs, f"Attempting to authenticate user: {username}")
 
-                add_log(logs, f"Attempting LDAP bind for user: {login_username}")
-                connection.simple_bind_s(login_username, password)
-                add_log(logs, "SUCCESS: User authenticated successfully!", "success")
-
-            except ldap.INVALID_CREDENTIALS:
-                add_log(logs, "ERROR: Invalid credentials - authentication failed", "error")
-            except ldap.SERVER_DOWN as exc:
-                add_log(logs, f"ERROR: LDAP server is down or unreachable", "error")
-                add_log(logs, f"Details: {exc}", "error")
-                if "certificate" in str(exc).lower():
-                    add_log(logs, "HINT: This may be a TLS/SSL certificate issue", "error")
-            except ldap.CONNECT_ERROR as exc:
-                add_log(logs, f"ERROR: Could not connect to LDAP server", "error")
-                add_log(logs, f"Details: {exc}", "error")
-            except ldap.TIMEOUT:
-                add_log(logs, "ERROR: LDAP operation timed out", "error")
-            except ldap.LDAPError as exc:
-                add_log(logs, f"LDAP ERROR: {type(exc).__name__}", "error")
-                error_info = exc.args[0] if exc.args else {}
-                if isinstance(error_info, dict):
-                    desc = error_info.get("desc", "Unknown error")
-                    info = error_info.get("info", "")
-                    add_log(logs, f"Description: {desc}", "error")
-                    if info:
-                        add_log(logs, f"Info: {info}", "error")
-                else:
-                    add_log(logs, f"Error details: {exc}", "error")
-            except socket.timeout:
-                add_log(logs, "ERROR: Connection timed out", "error")
-            except OSError as exc:
-                add_log(logs, f"OS ERROR: {exc}", "error")
-                add_log(logs, f"Error number: {exc.errno}", "error")
-            finally:
-                if connection:
-                    try:
-                        connection.unbind_s()
-                        add_log(logs, "LDAP connection closed")
-                    except Exception:
-                        add_log(logs, "LDAP connection cleanup (no active connection)")
-                else:
-                    add_log(logs, "No LDAP connection was established")
+            if not settings.host:
+                add_log(logs, "ERROR: LDAP host missing in .env", LEVEL_ERROR)
+            elif not username or not password:
+                add_log(logs, "ERROR: Username or password missing", LEVEL_ERROR)
+            else:
+                user_provided_domain = "@" in username
+                login_username = username if user_provided_domain or not settings.domain else f"{username}@{settings.domain}"
+                add_log(logs, f"Attempting authentication with: {login_username}")
+                if not logs.abandoned:
+                    _do_bind(logs, settings, login_username, password)
+    except Exception as exc:
+        # The response headers are already sent, so report the failure in the log.
+        add_log(logs, f"ERROR: Unexpected failure - {type(exc).__name__}: {exc}", LEVEL_ERROR)
+    finally:
+        logs.close()
 
-    return render_template_string(
-        HTML_TEMPLATE,
-        logs=logs,
-        username=request.form.get("username", "").strip(),
-    )
+
+@app.route("/", methods=["GET", "POST"])
+def ldap_test() -> Response:
+    username = request.form.get("username", "").strip()
+    password = request.form.get("password", "")
+
+    logs = LogQueue()
+    env_path = f"{app.root_path}/.env"
+    if request.method != "POST":
+        _run_test(logs, env_path, False, username, password)
+    elif not _submit_ldap_work(_run_test, logs, env_path, True, username, password):
+        add_log(logs, f"ERROR: Server busy - {LDAP_EXECUTOR_WORKERS} LDAP tests already running, try again shortly", LEVEL_ERROR)
+        logs.close()
+    return Response(stream_page(escape(username), logs), mimetype="text/html")
 
 
 if __name__ == "__main__":
+    startup_settings = _settings(f"{app.root_path}/.env")
+    if startup_settings.warmup and startup_settings.host:
+        _submit_ldap_work(warm_up, startup_settings)
     app.run(host="127.0.0.1", port=8001, debug=False)